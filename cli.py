@@ -4,18 +4,24 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import atexit
 import logging
 import logging.config
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
 import yaml
 from dotenv import load_dotenv
 
-from handbook import CourseList, CourseParser, HandbookCrawler, CourseWriter, CrawlSettings
+from handbook import CourseCache, CourseList, CourseParser, HandbookCrawler, CourseWriter, CrawlSettings
 
 LOGGER = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader; PyYAML builds without libyaml lack it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def configure_logging(logging_path: Path) -> None:
     if not logging_path.exists():
@@ -25,13 +31,22 @@ def configure_logging(logging_path: Path) -> None:
 
     logging.config.fileConfig(logging_path, disable_existing_loggers=False, defaults={"sys": sys})
 
+    # Emit records from a background thread so concurrent crawl tasks never
+    # block on the console handler's lock.
+    root = logging.getLogger()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+
 
 def read_settings(path: Path) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"Settings file not found: {path}")
 
     with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle)
+        return yaml.load(handle, Loader=YAML_LOADER)
 
 
 def build_argument_parser() -> argparse.ArgumentParser:
@@ -79,12 +94,17 @@ def create_crawler_components(settings: dict) -> tuple[CourseList, HandbookCrawl
         browser=crawler_cfg.get("browser", "chromium"),
         headless=bool(crawler_cfg.get("headless", True)),
         verbose=bool(crawler_cfg.get("verbose", False)),
-        delay_seconds=float(crawler_cfg.get("delay_seconds", 0.5)),
+        max_concurrency=int(crawler_cfg.get("max_concurrency", 10)),
+        rate_limit_delay=tuple(float(value) for value in crawler_cfg.get("rate_limit_delay", (1.0, 3.0))),
+        max_retries=int(crawler_cfg.get("max_retries", 3)),
         session_prefix=crawler_cfg.get("session_prefix", "unsw_handbook"),
     )
 
-    crawler = HandbookCrawler(parser=parser, settings=crawl_settings)
-    writer = CourseWriter()
+    cache_file = crawler_cfg.get("cache_file")
+    cache = CourseCache(cache_file) if cache_file else None
+
+    crawler = HandbookCrawler(parser=parser, settings=crawl_settings, cache=cache)
+    writer = CourseWriter(placeholder=parser.placeholder)
 
     return course_list, crawler, writer, handbook_cfg
 
@@ -129,14 +149,20 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     async def orchestrate() -> int:
-        records = await crawler.crawl(urls, css_selector=handbook_cfg.get("css_selector", "main"))
-        if not records:
+        output_path = handbook_cfg.get("output_file", "data/output/courses.csv")
+        try:
+            async with crawler:
+                records = crawler.crawl(urls, css_selector=handbook_cfg.get("css_selector", "main"))
+                exported = await writer.write_csv_async(records, output_path)
+        finally:
+            if crawler.cache is not None:
+                crawler.cache.close()
+
+        if exported is None:
             LOGGER.warning("No course data captured")
             return 1
 
-        output_path = handbook_cfg.get("output_file", "data/output/courses.csv")
-        destination = writer.write_csv(records, output_path)
-        report = writer.build_completeness_report(records)
+        destination, report = exported
         print(format_summary(report))
         LOGGER.info("Results stored at %s", destination)
         return 0
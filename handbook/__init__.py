@@ -1,11 +1,13 @@
 """Toolkit for acquiring and normalising UNSW Handbook course data."""
 
+from .cache import CourseCache
 from .loader import CourseList
 from .crawler import HandbookCrawler, CrawlSettings
 from .parser import CourseRecord, CourseParser
 from .writer import CourseWriter
 
 __all__ = [
+    "CourseCache",
     "CourseList",
     "HandbookCrawler",
     "CrawlSettings",
@@ -0,0 +1,68 @@
+"""SQLite-backed cache of parsed course records.
+
+Entries are keyed on the URL together with the extraction prompt and model, so
+editing `CourseParser.EXTRACTION_PROMPT` or switching providers naturally
+invalidates stale results. Delete the database file (and its `-wal`/`-shm`
+companions) to force a full re-scrape; Crawl4AI's own URL cache is bypassed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import List
+
+import orjson
+
+from .parser import CourseRecord
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CourseCache:
+    """Persist validated `CourseRecord` batches between scraper runs."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS courses (key TEXT PRIMARY KEY, payload BLOB, ts INTEGER)"
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def make_key(url: str, prompt: str, provider: str) -> str:
+        """Derive the cache key for a URL under a given prompt and model."""
+        return hashlib.sha256(f"{url}|{prompt}|{provider}".encode()).hexdigest()
+
+    def get(self, key: str) -> List[CourseRecord] | None:
+        """Return cached records for `key`, or `None` on a miss."""
+        row = self._connection.execute(
+            "SELECT payload FROM courses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            return [CourseRecord.model_validate(item) for item in orjson.loads(row[0])]
+        except (ValueError, TypeError) as exc:
+            LOGGER.warning("Discarding unreadable cache entry %s: %s", key, exc)
+            return None
+
+    def put(self, key: str, records: List[CourseRecord]) -> None:
+        """Store `records` under `key`, replacing any previous entry."""
+        payload = orjson.dumps([record.model_dump() for record in records])
+        self._connection.execute(
+            "INSERT OR REPLACE INTO courses (key, payload, ts) VALUES (?, ?, ?)",
+            (key, payload, int(time.time())),
+        )
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
@@ -1,15 +1,16 @@
 """Async interaction with the UNSW Handbook via Crawl4AI.
 
-Edit `CrawlSettings` defaults below if you need a different browser, delay,
-or session prefix when adapting the scraper.
+Edit `CrawlSettings` defaults below if you need a different browser,
+concurrency limit, request pacing, or session prefix when adapting the scraper.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+from collections import Counter
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+from typing import AsyncIterator, Dict, List, Sequence, Tuple
 from uuid import uuid4
 
 from crawl4ai import (
@@ -17,8 +18,12 @@ from crawl4ai import (
     BrowserConfig,
     CacheMode,
     CrawlerRunConfig,
+    CrawlResult,
+    MemoryAdaptiveDispatcher,
+    RateLimiter,
 )
 
+from .cache import CourseCache
 from .parser import CourseParser, CourseRecord
 
 LOGGER = logging.getLogger(__name__)
@@ -31,62 +36,173 @@ class CrawlSettings:
     browser: str = "chromium"  # Swap to "firefox"/"webkit" if required
     headless: bool = True
     verbose: bool = False
-    delay_seconds: float = 0.5
-    session_prefix: str = "unsw_handbook"
+    max_concurrency: int = 10  # Upper bound on concurrent browser sessions
+    rate_limit_delay: Tuple[float, float] = (1.0, 3.0)  # Random per-domain pause (seconds)
+    max_retries: int = 3  # Backoff retries for throttled (429/503) pages
+    session_prefix: str = "unsw_handbook"  # Only used when max_concurrency is 1
 
 
 class HandbookCrawler:
-    """Coordinates the Crawl4AI client and hands results to the parser."""
-
-    def __init__(self, parser: CourseParser, settings: CrawlSettings | None = None) -> None:
+    """Coordinates the Crawl4AI client and hands results to the parser.
+
+    The browser is started on the first `crawl()` call and kept open for later
+    calls; use the crawler as an async context manager (or call `close()`) to
+    release it.
+    """
+
+    def __init__(
+        self,
+        parser: CourseParser,
+        settings: CrawlSettings | None = None,
+        cache: CourseCache | None = None,
+    ) -> None:
         self.parser = parser
         self.settings = settings or CrawlSettings()
+        self.cache = cache
         self._browser_config = BrowserConfig(
             browser_type=self.settings.browser,
             headless=self.settings.headless,
             verbose=self.settings.verbose,
         )
         self._strategy = parser.build_strategy()
+        # Crawl4AI maps a session id to one browser tab, so concurrent fetches
+        # sharing it would race on the same page; only reuse a session when
+        # crawling one URL at a time.
+        self._session_id: str | None = None
+        if self.settings.max_concurrency <= 1:
+            self._session_id = f"{self.settings.session_prefix}_{uuid4().hex[:8]}"
+        self._run_configs: Dict[str, CrawlerRunConfig] = {}
+        self._crawler: AsyncWebCrawler | None = None
+
+    async def __aenter__(self) -> "HandbookCrawler":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Shut down the shared browser, if started; the cache stays with its owner."""
+        if self._crawler is not None:
+            await self._crawler.close()
+            self._crawler = None
+
+    async def crawl(self, urls: Sequence[str], *, css_selector: str) -> AsyncIterator[CourseRecord]:
+        """Yield course records as pages finish, serving cached URLs first."""
+        run_config = self._run_config(css_selector)
+        pending: List[str] = []
+        outcomes: Counter = Counter()
+        captured = 0
+
+        for url in urls:
+            cached = self._load_cached(url)
+            if cached is None:
+                pending.append(url)
+                continue
+            outcomes["cached"] += 1
+            captured += len(cached)
+            for record in cached:
+                yield record
+
+        if pending:
+            LOGGER.info("Fetching %d of %d page(s)", len(pending), len(urls))
+            dispatcher = MemoryAdaptiveDispatcher(
+                max_session_permit=max(1, self.settings.max_concurrency),
+                rate_limiter=RateLimiter(
+                    base_delay=self.settings.rate_limit_delay,
+                    max_retries=self.settings.max_retries,
+                ),
+            )
+
+            processed = 0
+            try:
+                crawler = await self._get_crawler()
+                stream = await crawler.arun_many(urls=pending, config=run_config, dispatcher=dispatcher)
+                async for result in stream:
+                    processed += 1
+                    try:
+                        outcome, records = await self._handle_result(result)
+                    except Exception:  # pragma: no cover - defensive logging
+                        LOGGER.exception("Processing failed for %s", result.url)
+                        outcome, records = "failed", []
+
+                    outcomes[outcome] += 1
+                    captured += len(records)
+                    for record in records:
+                        yield record
+            except Exception:  # pragma: no cover - defensive logging
+                LOGGER.exception("Crawler failed after %d of %d page(s)", processed, len(pending))
+                outcomes["failed"] += len(pending) - processed
+
+        LOGGER.info(
+            "Crawl finished: %d course(s) from %d page(s) (%s)",
+            captured,
+            len(urls),
+            ", ".join(f"{count} {outcome}" for outcome, count in sorted(outcomes.items())),
+        )
 
-    async def crawl(self, urls: Sequence[str], *, css_selector: str) -> List[CourseRecord]:
-        """Iterate through URLs and return the combined set of course records."""
-        session_id = f"{self.settings.session_prefix}_{uuid4().hex[:8]}"
-        harvested: List[CourseRecord] = []
-
-        async with AsyncWebCrawler(config=self._browser_config) as crawler:
-            for position, url in enumerate(urls, start=1):
-                LOGGER.info("[%d/%d] Fetching %s", position, len(urls), url)
-
-                try:
-                    result = await crawler.arun(
-                        url=url,
-                        config=CrawlerRunConfig(
-                            extraction_strategy=self._strategy,
-                            css_selector=css_selector,
-                            cache_mode=CacheMode.BYPASS,
-                            session_id=session_id,
-                        ),
-                    )
-                except Exception as exc:  # pragma: no cover - defensive logging
-                    LOGGER.error("Crawler failed for %s: %s", url, exc)
-                    continue
-
-                if not result.success:
-                    LOGGER.warning("Extraction failed for %s: %s", url, result.error_message)
-                    continue
-
-                if not result.extracted_content:
-                    LOGGER.warning("No content returned for %s", url)
-                    continue
-
-                records = self.parser.parse_payload(result.extracted_content)
-                if not records:
-                    LOGGER.warning("Parser produced no records for %s", url)
-                else:
-                    harvested.extend(records)
-                    LOGGER.info("Captured %d course(s) from %s", len(records), url)
-
-                if position < len(urls):
-                    await asyncio.sleep(self.settings.delay_seconds)
-
-        return harvested
+    async def _get_crawler(self) -> AsyncWebCrawler:
+        """Start the browser on first use and reuse it for later crawls."""
+        if self._crawler is None:
+            crawler = AsyncWebCrawler(config=self._browser_config)
+            await crawler.start()
+            self._crawler = crawler
+        return self._crawler
+
+    def _run_config(self, css_selector: str) -> CrawlerRunConfig:
+        """Return the shared run config for `css_selector`, building it on first use."""
+        run_config = self._run_configs.get(css_selector)
+        if run_config is None:
+            run_config = CrawlerRunConfig(
+                extraction_strategy=self._strategy,
+                css_selector=css_selector,
+                # Crawl4AI's cache is keyed by URL alone and would replay stale LLM
+                # output after prompt/model changes; CourseCache covers repeat runs.
+                cache_mode=CacheMode.BYPASS,
+                session_id=self._session_id,
+                stream=True,
+            )
+            self._run_configs[css_selector] = run_config
+        return run_config
+
+    def _cache_key(self, url: str) -> str:
+        return CourseCache.make_key(url, self.parser.EXTRACTION_PROMPT, self.parser.provider)
+
+    def _load_cached(self, url: str) -> List[CourseRecord] | None:
+        """Return previously parsed records for `url`, or `None` if it must be fetched."""
+        if self.cache is None:
+            return None
+
+        try:
+            cached = self.cache.get(self._cache_key(url))
+        except Exception:  # pragma: no cover - defensive logging
+            LOGGER.exception("Cache lookup failed for %s; fetching instead", url)
+            return None
+
+        if cached is not None:
+            LOGGER.debug("Loaded %d cached course(s) for %s", len(cached), url)
+        return cached
+
+    async def _handle_result(self, result: CrawlResult) -> Tuple[str, List[CourseRecord]]:
+        """Parse a single crawl result off the event loop and cache the records.
+
+        Returns an outcome label for the crawl summary alongside the records.
+        """
+        url = result.url
+
+        if not result.success:
+            LOGGER.warning("Extraction failed for %s: %s", url, result.error_message)
+            return "failed", []
+
+        if not result.extracted_content:
+            LOGGER.warning("No content returned for %s", url)
+            return "empty", []
+
+        records = await asyncio.to_thread(self.parser.parse_payload, result.extracted_content)
+        if not records:
+            LOGGER.warning("Parser produced no records for %s", url)
+            return "unparsed", []
+
+        LOGGER.debug("Captured %d course(s) from %s", len(records), url)
+        if self.cache is not None:
+            self.cache.put(self._cache_key(url), records)
+        return "captured", records
@@ -9,7 +9,14 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterator, List
+
+try:  # Optional: constant-memory parsing for very large course lists
+    import ijson
+except ImportError:  # pragma: no cover - falls back to the stdlib parser
+    ijson = None
+
+_IJSON_SCALAR_EVENTS = frozenset({"string", "number", "boolean", "null"})
 
 
 @dataclass(slots=True)
@@ -25,34 +32,64 @@ class CourseList:
         if not path.exists():
             raise FileNotFoundError(f"Course list file not found: {path}")
 
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"Invalid JSON in {path}: {exc}") from exc
-
-        raw_codes = payload.get("course_codes")
-        if not isinstance(raw_codes, Iterable) or isinstance(raw_codes, (str, bytes)):
-            raise ValueError("JSON must include an array named 'course_codes'")
-
-        cleaned = []
-        for code in raw_codes:
-            if not isinstance(code, str) or not code.strip():
+        # dict keys give O(1) de-duplication while preserving first-seen order
+        seen: Dict[str, None] = {}
+        for code in cls._iter_raw_codes(path):
+            if not isinstance(code, str):
                 continue
             code_upper = code.strip().upper()
-            if code_upper not in cleaned:
-                cleaned.append(code_upper)
+            if code_upper:
+                seen.setdefault(code_upper, None)
+        cleaned = list(seen)
 
         if not cleaned:
             raise ValueError(f"No usable course codes found in {path}")
 
         return cls(cleaned)
 
+    @staticmethod
+    def _iter_raw_codes(path: Path) -> Iterator[object]:
+        """Yield entries of the `course_codes` array, streaming when ijson is installed."""
+        missing = ValueError("JSON must include an array named 'course_codes'")
+
+        if ijson is None:
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Invalid JSON in {path}: {exc}") from exc
+
+            if not isinstance(payload, dict) or not isinstance(payload.get("course_codes"), list):
+                raise missing
+            yield from payload["course_codes"]
+            return
+
+        found = False
+        with path.open("rb") as handle:
+            try:
+                for prefix, event, value in ijson.parse(handle):
+                    if prefix == "course_codes.item":
+                        # Only scalar items matter; nested containers are skipped.
+                        if event in _IJSON_SCALAR_EVENTS:
+                            yield value
+                    elif prefix == "course_codes" and event != "end_array":
+                        if event != "start_array":
+                            raise missing
+                        found = True
+                    elif prefix == "" and event not in ("start_map", "map_key", "end_map"):
+                        raise missing
+            except ijson.JSONError as exc:
+                raise ValueError(f"Invalid JSON in {path}: {exc}") from exc
+
+        if not found:
+            raise missing
+
     def build_urls(self, template: str, *, level: str, year: int) -> List[str]:
         """Create handbook URLs from the provided template string."""
+        params = {"level": level, "year": year, "code": ""}
         urls = []
         for code in self.codes:
-            url = template.format(level=level, year=year, code=code)
-            urls.append(url)
+            params["code"] = code
+            urls.append(template.format_map(params))
         return urls
 
     def __iter__(self):
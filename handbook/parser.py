@@ -6,13 +6,14 @@ of the pipeline will automatically honour the updated schema.
 
 from __future__ import annotations
 
-import json
 import logging
 import os
-from typing import Dict, List
+from typing import Callable, Dict, List, Tuple
 
+import orjson
 from crawl4ai import LLMExtractionStrategy
-from pydantic import BaseModel, Field, ValidationError
+from crawl4ai.async_configs import LlmConfig
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +33,12 @@ class CourseRecord(BaseModel):
     school: str
 
 
+# Schema-derived constants; computed once rather than per record/strategy.
+_FIELD_NAMES: Tuple[str, ...] = tuple(CourseRecord.model_fields)
+_SCHEMA_JSON = CourseRecord.model_json_schema()
+_LIST_ADAPTER = TypeAdapter(List[CourseRecord])
+
+
 class CourseParser:
     """Prepares the LLM extraction prompt and validates the resulting payload."""
 
@@ -54,28 +61,32 @@ class CourseParser:
     """.strip()
 
     def __init__(self, provider: str, placeholder: str = "Not specified") -> None:
-        self.provider = provider
-        self.placeholder = placeholder
-
-    def build_strategy(self) -> LLMExtractionStrategy:
-        """Create a Crawl4AI extraction strategy using the course schema."""
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY environment variable is required")
 
-        return LLMExtractionStrategy(
-            provider=self.provider,
-            api_token=api_key,
-            instruction=self.EXTRACTION_PROMPT,
-            schema=CourseRecord.model_json_schema(),
-            extraction_type="structured",
-        )
+        self.provider = provider
+        self.placeholder = placeholder
+        self._api_key = api_key
+        self._strategy: LLMExtractionStrategy | None = None
+        self._fill = _compile_filler(_FIELD_NAMES, self._coerce_to_string)
 
-    def parse_payload(self, raw_payload: str) -> List[CourseRecord]:
+    def build_strategy(self) -> LLMExtractionStrategy:
+        """Return the Crawl4AI extraction strategy, creating it on first use."""
+        if self._strategy is None:
+            self._strategy = LLMExtractionStrategy(
+                llmConfig=LlmConfig(provider=self.provider, api_token=self._api_key),
+                instruction=self.EXTRACTION_PROMPT,
+                schema=_SCHEMA_JSON,
+                extraction_type="structured",
+            )
+        return self._strategy
+
+    def parse_payload(self, raw_payload: str | bytes) -> List[CourseRecord]:
         """Convert the LLM JSON string into validated `CourseRecord` objects."""
         try:
-            data = json.loads(raw_payload)
-        except json.JSONDecodeError as exc:
+            data = orjson.loads(raw_payload)
+        except orjson.JSONDecodeError as exc:
             LOGGER.error("LLM payload was not valid JSON: %s", exc)
             return []
 
@@ -87,32 +98,40 @@ class CourseParser:
             LOGGER.warning("Unexpected payload type: %s", type(data))
             return []
 
-        records: List[CourseRecord] = []
+        indices: List[int] = []
+        normalised: List[Dict[str, str]] = []
         for index, item in enumerate(items):
             if not isinstance(item, dict):
                 LOGGER.debug("Ignoring non-dict entry at index %d", index)
                 continue
+            if item.get("error") is True:
+                # Crawl4AI reports LLM failures (e.g. rate limits) as error blocks
+                LOGGER.warning("LLM reported an error at index %d: %s", index, item.get("content"))
+                continue
+            indices.append(index)
+            normalised.append(self._apply_placeholder(item))
 
-            normalised = self._apply_placeholder(item)
+        try:
+            return _LIST_ADAPTER.validate_python(normalised)
+        except ValidationError as exc:
+            failed = {error["loc"][0] for error in exc.errors() if error["loc"]}
 
+        # Only the failing subset is re-validated one at a time, for its error message.
+        records: List[CourseRecord] = []
+        for position, (index, payload) in enumerate(zip(indices, normalised)):
             try:
-                record = CourseRecord(**normalised)
+                if position in failed:
+                    records.append(CourseRecord.model_validate(payload))
+                else:
+                    records.append(CourseRecord.model_construct(**payload))
             except ValidationError as exc:
                 LOGGER.warning("Validation failure at index %d: %s", index, exc)
-                continue
-
-            records.append(record)
 
         return records
 
     def _apply_placeholder(self, item: Dict[str, object]) -> Dict[str, str]:
         """Ensure all required fields are populated and stripped."""
-        filled: Dict[str, str] = {}
-        for field_name in CourseRecord.model_fields.keys():
-            raw_value = item.get(field_name)
-            text = self._coerce_to_string(raw_value)
-            filled[field_name] = text if text else self.placeholder
-        return filled
+        return self._fill(item, self.placeholder)
 
     @staticmethod
     def _coerce_to_string(value: object) -> str:
@@ -123,3 +142,26 @@ class CourseParser:
         if isinstance(value, str):
             return value.strip()
         return str(value)
+
+
+def _compile_filler(
+    field_names: Tuple[str, ...], coerce: Callable[[object], str]
+) -> Callable[[Dict[str, object], str], Dict[str, str]]:
+    """Generate an unrolled `_apply_placeholder` body for a fixed field set.
+
+    The returned function builds the whole record as a single dict literal,
+    avoiding the per-field loop on the parser hot path.
+    """
+    entries = "".join(
+        f"        {name!r}: _coerce(get({name!r})) or placeholder,\n" for name in field_names
+    )
+    source = (
+        "def _fill(item, placeholder):\n"
+        "    get = item.get\n"
+        "    return {\n"
+        f"{entries}"
+        "    }\n"
+    )
+    namespace: Dict[str, object] = {"_coerce": coerce}
+    exec(compile(source, "<course-record-filler>", "exec"), namespace)
+    return namespace["_fill"]
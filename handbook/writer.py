@@ -8,9 +8,9 @@ from __future__ import annotations
 
 import csv
 import logging
-from collections import Counter
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, List
+from typing import AsyncIterable, Callable, Iterable, List, TextIO, Tuple
 
 from .parser import CourseRecord
 
@@ -20,51 +20,125 @@ LOGGER = logging.getLogger(__name__)
 class CourseWriter:
     """Persist course data and produce lightweight quality reports."""
 
-    def __init__(self, *, encoding: str = "utf-8", newline: str = "") -> None:
+    def __init__(
+        self,
+        *,
+        encoding: str = "utf-8",
+        newline: str = "",
+        placeholder: str | None = None,
+        flush_every: int = 100,
+    ) -> None:
         self.encoding = encoding
         self.newline = newline
-        self.field_order = list(CourseRecord.model_fields.keys())
+        self.placeholder = placeholder  # Values equal to this count as missing
+        self.flush_every = flush_every  # Rows between checkpoints to disk
+        self.field_order = list(CourseRecord.model_fields)
 
-    def write_csv(self, records: Iterable[CourseRecord], destination: Path | str) -> Path:
-        records = list(records)
-        if not records:
-            raise ValueError("No course records were provided for export")
-
-        path = Path(destination)
-        path.parent.mkdir(parents=True, exist_ok=True)
+    def write_csv(self, records: Iterable[CourseRecord], destination: Path | str) -> Tuple[Path, dict]:
+        """Stream records to CSV and return the path plus a completeness report.
 
-        with path.open("w", encoding=self.encoding, newline=self.newline) as handle:
-            writer = csv.DictWriter(handle, fieldnames=self.field_order)
-            writer.writeheader()
+        Rows are written as they are consumed, so `records` may be any iterator;
+        field coverage is tallied in the same pass.
+        """
+        with _CsvExport(self, destination) as export:
             for record in records:
-                writer.writerow(record.model_dump())
+                export.write(record)
 
-        LOGGER.info("Wrote %d course rows to %s", len(records), path)
-        return path
-
-    @staticmethod
-    def build_completeness_report(records: Iterable[CourseRecord]) -> dict:
-        """Calculate how frequently each field was populated."""
-        records = list(records)
-        total = len(records)
+        result = export.finish()
+        if result is None:
+            raise ValueError("No course records were provided for export")
+        return result
+
+    async def write_csv_async(
+        self, records: AsyncIterable[CourseRecord], destination: Path | str
+    ) -> Tuple[Path, dict] | None:
+        """Async counterpart of `write_csv` that flushes rows as they arrive.
+
+        The file is flushed every `flush_every` rows so a long crawl that fails
+        part-way still leaves the rows captured so far on disk. Returns `None`
+        (leaving the destination untouched) when `records` yields nothing.
+        """
+        with _CsvExport(self, destination) as export:
+            async for record in records:
+                export.write(record)
+        return export.finish()
+
+    def _summarise(self, total: int, counts: List[int]) -> dict:
+        """Turn per-field presence counts into the completeness report."""
         summary = {"total_courses": total, "fields": {}}
-
-        if total == 0:
-            return summary
-
-        counters = Counter()
-        for record in records:
-            data = record.model_dump()
-            for key, value in data.items():
-                if isinstance(value, str) and value.strip():
-                    counters[key] += 1
-
-        for key in CourseRecord.model_fields.keys():
-            present = counters.get(key, 0)
+        for key, present in zip(self.field_order, counts):
             summary["fields"][key] = {
                 "present": present,
                 "missing": total - present,
                 "percent_present": round((present / total) * 100, 1),
             }
-
         return summary
+
+
+class _CsvExport:
+    """Single CSV export in progress: writes rows and tallies field coverage.
+
+    The destination is only opened once the first record arrives, so an export
+    with no records leaves any existing file untouched.
+    """
+
+    def __init__(self, owner: CourseWriter, destination: Path | str) -> None:
+        self.owner = owner
+        self.path = Path(destination)
+        self.total = 0
+        self.counts = [0] * len(owner.field_order)
+        self._row_getter = _row_getter(owner.field_order)
+        self._handle: TextIO | None = None
+        self._writer = None
+
+    def __enter__(self) -> "_CsvExport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._handle is not None:
+            self._handle.close()
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("w", encoding=self.owner.encoding, newline=self.owner.newline)
+        self._writer = csv.writer(self._handle)
+        self._writer.writerow(self.owner.field_order)
+
+    def write(self, record: CourseRecord) -> None:
+        if self._handle is None:
+            self._open()
+
+        row = self._row_getter(record)
+        self._writer.writerow(row)
+
+        placeholder = self.owner.placeholder
+        counts = self.counts
+        for index, value in enumerate(row):
+            if value and value != placeholder:
+                counts[index] += 1
+
+        self.total += 1
+        if self.owner.flush_every and self.total % self.owner.flush_every == 0:
+            self._handle.flush()
+
+    def finish(self) -> Tuple[Path, dict] | None:
+        if self.total == 0:
+            return None
+
+        LOGGER.info("Wrote %d course rows to %s", self.total, self.path)
+        return self.path, self.owner._summarise(self.total, self.counts)
+
+
+def _row_getter(field_order: List[str]) -> Callable[[CourseRecord], Tuple[object, ...]]:
+    """Build a getter returning a record's values as a tuple in `field_order`.
+
+    `attrgetter` returns a bare value (not a 1-tuple) for a single name, which
+    `csv.writer` would split into one column per character.
+    """
+    if not field_order:
+        raise ValueError("CourseWriter.field_order must name at least one field")
+
+    getter = attrgetter(*field_order)
+    if len(field_order) == 1:
+        return lambda record: (getter(record),)
+    return getter